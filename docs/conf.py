@@ -34,10 +34,12 @@ exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store']
 html_theme = 'sphinx_rtd_theme'
 html_static_path = ['_static']
 
+# Prefer the local-only copies in _inv/ (see `make refresh-inv`), falling
+# back to downloading them. Sphinx already fetches the projects concurrently.
 intersphinx_mapping = {
-    'python': ('https://docs.python.org/3', None),
-    'bleak': ('https://bleak.readthedocs.io/en/latest/', None),
-    'aioevents': ('https://aioevents.readthedocs.io/en/stable/', None),
+    'python': ('https://docs.python.org/3', ('_inv/python.inv', None)),
+    'bleak': ('https://bleak.readthedocs.io/en/latest/', ('_inv/bleak.inv', None)),
+    'aioevents': ('https://aioevents.readthedocs.io/en/stable/', ('_inv/aioevents.inv', None)),
     # Textual
 }
 
@@ -1,9 +1,26 @@
-from sphinx.util.inventory import InventoryFile
+import re
+
+from sphinx.util.inventory import InventoryFileReader
+
+# Same line format as sphinx.util.inventory.InventoryFile.load_v2()
+LINE = re.compile(r'(.+?)\s+(\S+)\s+(-?\d+)\s+?(\S*)\s+(.*)')
 
 with open('./_build/html/objects.inv', 'rb') as invfile:
-    inv = InventoryFile.load(invfile, '', lambda a, b: b)
+    reader = InventoryFileReader(invfile)
+    reader.readline()  # Version header
+    projname = reader.readline().rstrip()[11:]
+    version = reader.readline().rstrip()[11:]
+    reader.readline()  # Compression header
 
-# {<domain:kind>: {<name>: tuple}}
-for prefix, items in inv.items():
-    for name, info in items.items():
+    # Print as we decompress, instead of loading the whole inventory first
+    for line in reader.read_compressed_lines():
+        m = LINE.match(line.rstrip())
+        if not m:
+            continue
+        name, prefix, _, location, dispname = m.groups()
+        if ':' not in prefix:
+            continue
+        if location.endswith('$'):
+            location = location[:-1] + name
+        info = (projname, version, location, dispname)
         print(f"{prefix}:{name}: {info!r}")
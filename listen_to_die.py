@@ -4,7 +4,7 @@ import logging.config
 
 from nat20 import scan_for_dice
 
-logging.config.dictConfig({
+LOG_CONFIG = {
     'version': 1,
     'disable_existing_loggers': True,
     'formatters': {
@@ -32,7 +32,9 @@ logging.config.dictConfig({
             'propagate': False
         },
     }
-})
+}
+
+logging.config.dictConfig(LOG_CONFIG)
 
 
 async def main():
@@ -63,15 +65,15 @@ async def main():
         #     loop=0,
         # )
         print(1)
-        await die.blink(color=0x000000FF, duration=3, fade=0)
+        await die.blink_seconds(color=0x000000FF, duration=3, fade=0)
         await asyncio.sleep(3)
         print(2)
-        await die.blink(color=0x0000FF00, duration=3, fade=0x7F)
+        await die.blink_seconds(color=0x0000FF00, duration=3, fade=0x7F)
         await asyncio.sleep(3)
         print(3)
-        await die.blink(color=0x00FF0000, duration=3, fade=0xFF)
+        await die.blink_seconds(color=0x00FF0000, duration=3, fade=0xFF)
         await asyncio.sleep(3)
-        await die.blink(color=0xFFFFFF, duration=5, fade=0xEE, count=...)
+        await die.blink_seconds(color=0xFFFFFF, duration=5, fade=0xEE, count=...)
 
         await asyncio.sleep(10)
         await die.stop_all_animations()
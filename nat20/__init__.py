@@ -10,6 +10,7 @@ Primary interface to Pixels dice.
         die.blink_id(0x80)
 """
 import asyncio
+import collections
 from collections.abc import AsyncGenerator, AsyncIterable
 import contextlib
 import dataclasses
@@ -18,13 +19,10 @@ import enum
 import logging
 import struct
 from types import EllipsisType
-from typing import Self
+from typing import Callable, Self, TYPE_CHECKING
 
 import aioevents
-import bleak
 
-from .constants import SERVICE_PIXELS, SERVICE_INFO
-from .link import PixelLink
 from .messages import (
     DesignAndColor, WhoAreYou, IAmADie, DieFlavor,
     RequestRollState, RollState, RollState_State,
@@ -36,10 +34,28 @@ from .messages import (
     NotifyUser, NotifyUserAck, OkCancel,
     Calibrate, CalibrateFace,
     RequestTemperature, Temperature,
+    _DESIGN_BY_VALUE, _ROLLSTATE_BY_VALUE, _FLAVOR_BY_LED_COUNT, _build_dt,
 )  # Also, import .messages so everything gets registered
 
+if TYPE_CHECKING:
+    import bleak
+    from .link import PixelLink
+
+# bleak (and .link/.constants, which pull it in) is only imported once a scan
+# or connection actually starts, so that just importing nat20 (eg for
+# nat20.messages) stays cheap.
+
 LOG = logging.getLogger(__name__)
 
+#: Layout of a die's advertisement: the manufacturer data (5 bytes) followed
+#: by the service data
+_unpack_adv = struct.Struct("<BBBBB II").unpack
+_MDATA_SIZE = 5
+#: How many unconsumed advertisements scan_for_dice() holds on to
+_SCAN_BUFFER_SIZE = 64
+_new = object.__new__
+
+
 # Since these are protocol definitions, I would prefer to use explicit numbers
 # in enums, but none of the first-party code does that.
 
@@ -60,19 +76,92 @@ class ScanBattState(enum.IntEnum):
         Note that due to data fidelity, the state can only be
         :attr:`.BatteryState.Ok` or :attr:`.BatteryState.Charging`.
         """
-        match self:
-            case ScanBattState.Ok:
-                return BatteryState.Ok
-            case ScanBattState.Charging:
-                return BatteryState.Charging
-            case _:
-                # Can't happen, but covering bases
-                return BatteryState.Error
+        # Anything else can't happen, but covering bases
+        return _SCAN_TO_BATT.get(self, BatteryState.Error)
+
+
+_SCAN_TO_BATT = {
+    ScanBattState.Ok: BatteryState.Ok,
+    ScanBattState.Charging: BatteryState.Charging,
+}
+
+# Indexed by the top bit of the battery byte
+_BATT_STATES = (ScanBattState.Ok, ScanBattState.Charging)
+
+# Change sets for Pixel.data_changed
+_CHANGED_ROLL = frozenset({'roll_state', 'roll_face'})
+_CHANGED_BATT = frozenset({'batt_state', 'batt_level'})
+_CHANGED_NAME = frozenset({'name'})
+_CHANGED_INFO = frozenset({
+    'roll_state', 'roll_face', 'batt_state', 'batt_level',
+    'build_timestamp', 'design_and_color', 'pixel_id',
+})
+
+
+def _trigger(event: aioevents.BoundEvent, *pargs):
+    """
+    Triggers the event, skipping all the machinery if nobody is listening.
+    """
+    # A BoundEvent is a set of its handlers, and the class-level ones are on
+    # the parent Event.
+    if event or event._pman:
+        event.trigger(*pargs)
+
+
+def _call_logged(cb: Callable, *pargs):
+    """
+    Calls the callback, logging any exception.
+    """
+    try:
+        cb(*pargs)
+    except Exception:
+        LOG.exception("Swallowed exception from callback %r", cb)
+
+
+def _call_each(callbacks: list[tuple[Callable, bool]], *pargs):
+    """
+    Immediately calls each of the callbacks, logging any exceptions.
+
+    Callbacks flagged for the executor are handed to the loop's default
+    executor instead of being called inline.
+    """
+    # Iterate a snapshot, so a callback can remove itself without the next
+    # one being skipped
+    for cb, in_executor in tuple(callbacks):
+        if in_executor:
+            asyncio.get_running_loop().run_in_executor(None, _call_logged, cb, *pargs)
+            continue
+        try:
+            cb(*pargs)
+        except Exception:
+            LOG.exception("Swallowed exception from callback %r", cb)
+
+
+def _add_callback(callbacks: list[tuple[Callable, bool]], callback: Callable, executor: bool):
+    """
+    Registers a callback for :func:`_call_each`.
+    """
+    if executor and asyncio.iscoroutinefunction(callback):
+        raise TypeError(
+            f"{callback!r} is a coroutine function, which can't run in an executor"
+        )
+    callbacks.append((callback, executor))
 
 
-@dataclasses.dataclass
+def _remove_callback(callbacks: list[tuple[Callable, bool]], callback: Callable):
+    """
+    Unregisters a callback added with :func:`_add_callback`.
+    """
+    for i, (cb, _) in enumerate(callbacks):
+        if cb == callback:
+            del callbacks[i]
+            return
+    raise ValueError(f"{callback!r} is not registered")
+
+
+@dataclasses.dataclass(slots=True)
 class ScanResult:
-    _device: bleak.backends.device.BLEDevice
+    _device: 'bleak.backends.device.BLEDevice'
     #: The name of the die
     name: str
     #: The number of LEDs and faces
@@ -91,41 +180,45 @@ class ScanResult:
     pixel_id: int
     #: The build date of the firmware
     build_timestamp: datetime.datetime
-
-    @property
-    def flavor(self) -> DieFlavor:
-        """
-        The kind of die this is, like D20 or Pipped D6
-        """
-        return DieFlavor._from_led_count(self.led_count)
+    #: The kind of die this is, like D20 or Pipped D6. :const:`None` if the
+    #: LED count isn't one we know.
+    flavor: DieFlavor | None
 
     @property
     def face_count(self) -> int:
         """
         The total number of faces
         """
+        if self.flavor is None:
+            # Unknown LED count, let _from_led_count() produce its usual error
+            return DieFlavor._from_led_count(self.led_count).face_count
         return self.flavor.face_count
 
     @classmethod
     def _construct(cls, device, name, mdata, sdata):
-        led_count, design, roll_state, face, batt = struct.unpack(
-            "<BBBBB", mdata)
-        id, build = struct.unpack("<II", sdata)
-        build = datetime.datetime.fromtimestamp(
-            build, tz=datetime.timezone.utc)
-
-        return cls(
-            _device=device,
-            name=name,
-            led_count=led_count,
-            design_and_color=DesignAndColor(design),
-            roll_state=RollState_State(roll_state),
-            roll_face=face,
-            batt_state=ScanBattState(batt >> 7),
-            batt_level=batt & 0x7F,
-            pixel_id=id,
-            build_timestamp=build,
-        )
+        if len(mdata) != _MDATA_SIZE:
+            # Otherwise a misplaced byte would shift the fields without an error
+            raise struct.error(f"manufacturer data is {len(mdata)} bytes, not {_MDATA_SIZE}")
+        led_count, design, roll_state, face, batt, id, build = _unpack_adv(mdata + sdata)
+        build = _build_dt(build)
+        # Unknown values fall through to the enums, for their usual error
+        design, roll_state = _DESIGN_BY_VALUE[design], _ROLLSTATE_BY_VALUE[roll_state]
+
+        # Fill the slots directly, skipping __init__'s argument handling; this
+        # runs for every advertisement.
+        self = _new(cls)
+        self._device = device
+        self.name = name
+        self.led_count = led_count
+        self.design_and_color = design
+        self.roll_state = roll_state
+        self.roll_face = face
+        self.batt_state = _BATT_STATES[batt >> 7]
+        self.batt_level = batt & 0x7F
+        self.pixel_id = id
+        self.build_timestamp = build
+        self.flavor = _FLAVOR_BY_LED_COUNT.get(led_count)
+        return self
 
     def to_rollstate(self) -> 'RollState':
         """
@@ -159,22 +252,43 @@ async def scan_for_dice() -> AsyncIterable[ScanResult]:
     """
     Search for dice. Will scan forever as long as the iterator is live.
 
+    Dice re-send the same advertisement constantly; a die is only produced again
+    once something in its advertisement has changed.
+
     For timeouts, :func:`asyncio.timeout` might be helpful.
     """
-    q = asyncio.Queue()
+    import bleak
+    from .constants import SERVICE_PIXELS, SERVICE_INFO
 
-    def detected(device, ad_data):
-        if (
-            0xFFFF in ad_data.manufacturer_data and
-            SERVICE_INFO in ad_data.service_data
-        ):
-            sr = ScanResult._construct(
-                device, ad_data.local_name,
-                ad_data.manufacturer_data[0xFFFF],
-                ad_data.service_data[SERVICE_INFO],
-            )
-            q.put_nowait(sr)
+    # Advertisements are only interesting while they're fresh, so if the
+    # consumer falls behind, let the oldest ones fall off.
+    buf = collections.deque(maxlen=_SCAN_BUFFER_SIZE)
+    ready = asyncio.Event()
+    # address -> last advertisement payload
+    last_seen: dict[str, tuple] = {}
 
+    def detected(device, ad_data):
+        # Called for every advertisement, so keep the reject path cheap
+        if (mdata := ad_data.manufacturer_data.get(0xFFFF)) is None:
+            return
+        if (sdata := ad_data.service_data.get(SERVICE_INFO)) is None:
+            return
+        if last_seen.get(device.address) == (seen := (ad_data.local_name, mdata, sdata)):
+            return
+        if len(buf) == buf.maxlen:
+            # The oldest entry is about to be dropped without being yielded, so
+            # forget it was seen, unless that die has since sent something newer
+            old_device, old_seen = buf[0]
+            if last_seen.get(old_device.address) == old_seen:
+                del last_seen[old_device.address]
+        last_seen[device.address] = seen
+        # Parsing waits until the consumer asks, so anything that falls off the
+        # buffer is never parsed at all
+        buf.append((device, seen))
+        ready.set()
+
+    # This has to be an active scan: the interesting data is in the scan
+    # response, which passive scanning never requests.
     scanner = bleak.BleakScanner(
         detection_callback=detected,
         service_uuids=[SERVICE_PIXELS],
@@ -182,7 +296,17 @@ async def scan_for_dice() -> AsyncIterable[ScanResult]:
 
     async with scanner:
         while True:
-            yield await q.get()
+            # Hand out everything that's buffered before going back to the loop
+            while buf:
+                device, seen = buf.popleft()
+                try:
+                    sr = ScanResult._construct(device, *seen)
+                except Exception:
+                    LOG.exception("Unable to parse advertisement from %s", device.address)
+                else:
+                    yield sr
+            ready.clear()
+            await ready.wait()
 
 
 class Pixel:
@@ -197,10 +321,22 @@ class Pixel:
     # so might as well make that part of the data model. And then users can
     # scan by name or ID or whatever.
 
+    __slots__ = (
+        'name', 'led_count', 'flavor', 'design_and_color', 'pixel_id',
+        'build_timestamp', 'roll_state', 'roll_face', 'batt_level',
+        'batt_state', '_expected_disconnect', '_link', '_device',
+        '_roll_callbacks', '_battery_callbacks', '_address',
+        # aioevents keeps per-instance events in a WeakKeyDictionary
+        '__weakref__',
+    )
+
     #: The textual name of the die.
     name: str
     #: Number of LEDs
     led_count: int
+    #: The kind of die this is, like D20 or Pipped D6. :const:`None` if the
+    #: LED count isn't one we know.
+    flavor: DieFlavor | None
     #: The aesthetic design of the die
     design_and_color: DesignAndColor
     #: The factory-assigned die ID
@@ -218,32 +354,36 @@ class Pixel:
     #: Current battery percent
     batt_state: BatteryState
 
-    _expected_disconnect: bool = False
+    _expected_disconnect: bool
+
+    _link: 'PixelLink'
+    _address: str
 
-    _link: PixelLink
+    # (callback, run in executor) pairs
+    _roll_callbacks: list[tuple[Callable[[RollState], None], bool]]
+    _battery_callbacks: list[tuple[Callable[[BatteryLevel], None], bool]]
 
+    # aioevents schedules handlers on the loop (sync ones via call_soon, async
+    # ones as tasks) instead of calling them inline, so a slow handler never
+    # holds up processing of the next notification from the die.
     got_roll_state = aioevents.Event("(rs: RollState) A new RollState has been sent.")
     got_battery_level = aioevents.Event("(bl: BatteryLevel) A new BatteryState has been sent.")
     data_changed = aioevents.Event(
-        "(cl: set[str]) Any of the props changed, giving the set of which ones"
+        "(cl: frozenset[str]) Any of the props changed, giving the set of which ones"
     )
     disconnected = aioevents.Event("() We've been unexpectedly disconnected from the die.")
     notify_user = aioevents.Event(
         "(cb: Callable[[OkCancel], None]) The die has something to tell the user."
     )
 
-    @property
-    def flavor(self) -> DieFlavor:
-        """
-        The kind of die this is, like D20 or Pipped D6
-        """
-        return DieFlavor._from_led_count(self.led_count)
-
     @property
     def face_count(self) -> int:
         """
         The total number of faces
         """
+        if self.flavor is None:
+            # Unknown LED count, let _from_led_count() produce its usual error
+            return DieFlavor._from_led_count(self.led_count).face_count
         return self.flavor.face_count
 
     def to_rollstate(self) -> RollState:
@@ -273,8 +413,13 @@ class Pixel:
 
         :meta private:
         """
+        import bleak
+        from .constants import SERVICE_PIXELS, SERVICE_INFO
+        from .link import PixelLink
+
         self.name = sr.name
         self.led_count = sr.led_count
+        self.flavor = sr.flavor
         self.design_and_color = sr.design_and_color
         self.pixel_id = sr.pixel_id
         self.build_timestamp = sr.build_timestamp
@@ -284,17 +429,21 @@ class Pixel:
         self.batt_state = sr.batt_state.as_batterystate()
 
         self._device = sr._device
+        # The address can't change, so don't dig through bleak for it every time
+        self._address = sr._device.address
+        self._expected_disconnect = False
+        self._roll_callbacks = []
+        self._battery_callbacks = []
 
         self._link = PixelLink(bleak.BleakClient(
             sr._device,
             services=[SERVICE_INFO, SERVICE_PIXELS],
-            disconnected_callback=lambda c: asyncio.create_task(
-                self._on_disconnect(c)),
+            disconnected_callback=self._on_disconnect,
         ))
 
-        self._link._message_handlers[RollState].append(self._on_roll_state)
-        self._link._message_handlers[BatteryLevel].append(self._on_battery_level)
-        self._link._message_handlers[NotifyUser].append(self._on_notify_user)
+        self._link.set_handler(RollState, self._on_roll_state)
+        self._link.set_handler(BatteryLevel, self._on_battery_level)
+        self._link.set_handler(NotifyUser, self._on_notify_user)
 
     async def connect(self):
         """
@@ -326,28 +475,75 @@ class Pixel:
             self.disconnected.remove(reconnect)
             await self.disconnect()
 
-    async def _on_disconnect(self, client):
+    def add_roll_callback(
+        self, callback: Callable[[RollState], None], *, executor: bool = False,
+    ):
+        """
+        Registers a plain function to be called synchronously with every
+        :class:`.RollState` broadcast by the die.
+
+        This is a cheaper alternative to :attr:`got_roll_state` for
+        high-frequency, non-async consumers. The callback runs inline while
+        the message is being processed, so it must be quick and must not
+        block. Exceptions are logged and swallowed.
+
+        If the callback does slow work, pass ``executor=True`` to have it run
+        in the event loop's default executor instead. It can't be a coroutine
+        function then; that raises :exc:`TypeError`.
+
+        Returns the callback, so this can be used as a decorator.
+        """
+        _add_callback(self._roll_callbacks, callback, executor)
+        return callback
+
+    def remove_roll_callback(self, callback: Callable[[RollState], None]):
+        """
+        Unregisters a callback added with :meth:`add_roll_callback`.
+        """
+        _remove_callback(self._roll_callbacks, callback)
+
+    def add_battery_callback(
+        self, callback: Callable[[BatteryLevel], None], *, executor: bool = False,
+    ):
+        """
+        Like :meth:`add_roll_callback`, but for :class:`.BatteryLevel`
+        broadcasts. See also :attr:`got_battery_level`.
+        """
+        _add_callback(self._battery_callbacks, callback, executor)
+        return callback
+
+    def remove_battery_callback(self, callback: Callable[[BatteryLevel], None]):
+        """
+        Unregisters a callback added with :meth:`add_battery_callback`.
+        """
+        _remove_callback(self._battery_callbacks, callback)
+
+    def _on_disconnect(self, client):
+        # Nothing here awaits (triggering only schedules the handlers), so
+        # there's no need to spin up a task for every disconnect.
         if not self._expected_disconnect:
             LOG.info("Disconnected from %r", client)
-            self.disconnected.trigger()
+            _trigger(self.disconnected)
 
     def _on_roll_state(self, msg: RollState):
         self.roll_state = msg.state
         self.roll_face = msg.face
-        self.data_changed.trigger({'roll_state', 'roll_face'})
-        self.got_roll_state.trigger(msg)
+        _call_each(self._roll_callbacks, msg)
+        _trigger(self.data_changed, _CHANGED_ROLL)
+        _trigger(self.got_roll_state, msg)
 
     def _on_battery_level(self, msg: BatteryLevel):
         self.batt_state = msg.state
         self.batt_level = msg.level
-        self.data_changed.trigger({'batt_state', 'batt_level'})
-        self.got_battery_level.trigger(msg)
+        _call_each(self._battery_callbacks, msg)
+        _trigger(self.data_changed, _CHANGED_BATT)
+        _trigger(self.got_battery_level, msg)
 
     def _on_notify_user(self, msg: NotifyUser):
         def respond(resp: OkCancel) -> asyncio.Future | asyncio.Task:
             return asyncio.create_task(self._link.send(NotifyUserAck(resp)))
 
-        self.notify_user.trigger(msg.text, msg.ok, msg.cancel, msg.timeout, respond)
+        _trigger(self.notify_user, msg.text, msg.ok, msg.cancel, msg.timeout, respond)
 
     def __repr__(self):
         return (
@@ -361,7 +557,7 @@ class Pixel:
         """
         The MAC address (UUID on macOS) of the die.
         """
-        return self._link.address
+        return self._address
 
     @property
     def is_connected(self) -> bool:
@@ -385,12 +581,10 @@ class Pixel:
         self.build_timestamp = msg.build_timestamp
         self.design_and_color = msg.design_and_color
         self.led_count = msg.led_count
+        self.flavor = _FLAVOR_BY_LED_COUNT.get(msg.led_count)
         self.pixel_id = msg.pixel_id
 
-        self.data_changed.trigger({
-            'roll_state', 'roll_face', 'batt_state', 'batt_level',
-            'build_timestamp', 'design_and_color', 'pixel_id',
-        })
+        _trigger(self.data_changed, _CHANGED_INFO)
         return msg
 
     async def what_do_you_want(self):
@@ -412,9 +606,11 @@ class Pixel:
         Request the current roll state.
         """
         msg = await self._link.send_and_wait(RequestRollState(), RollState)
+        # Replies go to the waiter instead of _on_roll_state(), so this is the
+        # only place the change gets announced.
         self.roll_state = msg.state
         self.roll_face = msg.face
-        self.data_changed.trigger({'roll_state', 'roll_face'})
+        _trigger(self.data_changed, _CHANGED_ROLL)
         return msg
 
     async def get_battery_level(self) -> BatteryLevel:
@@ -422,15 +618,16 @@ class Pixel:
         Request the current battery level.
         """
         msg = await self._link.send_and_wait(RequestBatteryLevel(), BatteryLevel)
+        # Like get_roll_state(), _on_battery_level() doesn't see this reply.
         self.batt_level = msg.level
         self.batt_state = msg.state
-        self.data_changed.trigger({'batt_level', 'batt_state'})
+        _trigger(self.data_changed, _CHANGED_BATT)
         return msg
 
     async def blink(self, *,
                     color: int,
                     count: int | EllipsisType = 1,
-                    duration: float,
+                    duration_ms: int,
                     fade: int = 0,
                     led_mask: int = 0xFF,
                     ) -> None:
@@ -440,7 +637,7 @@ class Pixel:
         Args:
             color: The color to flash, in 0xRRGGBB
             count: The number of blinks to perform, or ``...`` to go until cancelled
-            duration: The time of each on-off loop, in seconds
+            duration_ms: The time of each on-off loop, in milliseconds
             fade: The amount of time to spend fading, as a 'percent' (0-255) of a half-loop
             led_mask: A bitmask of which LEDs to blink (1 means blink it, 0 means ignore it)
 
@@ -454,15 +651,26 @@ class Pixel:
             Different animations can overlay each other and run in parallel.
         """
         loop, count = (1, 1) if count is ... else (0, count)
-        msg = Blink(
-            count=count,
-            duration=int(count * duration * 1000),
+        msg = Blink(count, count * duration_ms, color, led_mask, fade, loop)
+        await self._link.send_and_wait(msg, BlinkAck)
+
+    async def blink_seconds(self, *,
+                            color: int,
+                            count: int | EllipsisType = 1,
+                            duration: float,
+                            fade: int = 0,
+                            led_mask: int = 0xFF,
+                            ) -> None:
+        """
+        Like :meth:`blink`, but with ``duration`` given in seconds.
+        """
+        await self.blink(
             color=color,
-            face_mask=led_mask,
+            count=count,
+            duration_ms=round(duration * 1000),
             fade=fade,
-            loop=loop,
+            led_mask=led_mask,
         )
-        await self._link.send_and_wait(msg, BlinkAck)
 
     async def blink_id(self, brightness: int, loop: bool = False) -> None:
         """
@@ -501,7 +709,7 @@ class Pixel:
         """
         await self._link.send_and_wait(SetName(name=name), SetNameAck)
         self.name = name
-        self.data_changed.trigger({'name'})
+        _trigger(self.data_changed, _CHANGED_NAME)
 
     async def start_calibration(self) -> None:
         """
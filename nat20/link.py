@@ -3,6 +3,7 @@ Contains the messy details of communicating with a pixels die.
 """
 import asyncio
 import collections
+import functools
 import inspect
 import logging
 from typing import Callable, TypeVar
@@ -15,13 +16,20 @@ from .msglib import Message, pack, unpack
 LOG = logging.getLogger(__name__)
 
 
-def _call_or_task(func, *pargs, **kwargs):
+def _as_sync(func):
     """
-    Calls the given function. Async functions are wrapped in a Task.
+    Wraps a coroutine function so that calling it schedules a Task.
+
+    Plain functions are returned unchanged.
     """
-    rv = func(*pargs, **kwargs)
-    if inspect.isawaitable(rv):
-        asyncio.ensure_future(rv)
+    if not asyncio.iscoroutinefunction(func):
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*pargs, **kwargs):
+        asyncio.ensure_future(func(*pargs, **kwargs))
+
+    return wrapper
 
 
 async def _get_real_mtu(client):
@@ -41,11 +49,12 @@ class PixelLink:
     Not really meant to be user-accessible.
     """
     _client: bleak.BleakClient
+    _loop: asyncio.AbstractEventLoop
 
     # Ok, so the way message dispatch is handled:
     # 1. A message is received and parsed
     # 2. If there's any Futures in the in _wait_queue, give it to the first one
-    # 3. Otherwise, create tasks with each of _message_handlers
+    # 3. Otherwise, call the handler in _message_handlers, if there is one
     # This kinda assumes that if a message is used for both broadcast and
     # response, the message immediately following the send is the reply. Which
     # sounds untrue with network latency and asynchronous weirdness.
@@ -53,17 +62,26 @@ class PixelLink:
     #: Handlers waiting for a one-time response
     #:
     #: :meta public:
-    _wait_queue: dict[type, list[asyncio.Future]]
+    _wait_queue: dict[type, collections.deque[asyncio.Future]]
 
-    #: Event receivers
+    #: Event receivers, one per message type
     #:
     #: :meta public:
-    _message_handlers: dict[type, list[Callable[[Message], None]]]
+    _message_handlers: dict[type, Callable[[Message], None]]
 
     def __init__(self, client: bleak.BleakClient):
         self._client = client
-        self._wait_queue = collections.defaultdict(list)
-        self._message_handlers = collections.defaultdict(list)
+        self._wait_queue = collections.defaultdict(collections.deque)
+        self._message_handlers = {}
+
+    def set_handler(self, msgcls: type[ReplyKind], handler: Callable[[ReplyKind], None]):
+        """
+        Sets the handler for a message type, replacing any existing one.
+
+        Async handlers are scheduled as a Task when called, as is any awaitable
+        a sync handler returns.
+        """
+        self._message_handlers[msgcls] = _as_sync(handler)
 
     @property
     def address(self):
@@ -77,6 +95,7 @@ class PixelLink:
         """
         Does the bits necessary to start receiving stuff.
         """
+        self._loop = asyncio.get_running_loop()
         await self._client.connect()
         # https://github.com/hbldh/bleak/discussions/1350#discussioncomment-6308104
         # mtu = await _get_real_mtu(self._client)
@@ -91,10 +110,13 @@ class PixelLink:
         await self._client.stop_notify(CHARI_NOTIFY)
         await self._client.disconnect()
 
-    async def _recv_notify(self, _, packet: bytearray):
+    def _recv_notify(self, _, packet: bytearray):
         """
         Callback for bleak.
 
+        Deliberately synchronous: bleak wraps async callbacks in a new Task per
+        notification, which costs more than decoding the packet itself.
+
         :meta private:
         """
         try:
@@ -112,12 +134,15 @@ class PixelLink:
         """
         LOG.debug("Dispatching %r", message)
         msgcls = type(message)
-        if len(self._wait_queue[msgcls]):
-            fut = self._wait_queue[msgcls].pop(0)
-            fut.set_result(message)
-        else:
-            for handler in self._message_handlers[msgcls]:
-                _call_or_task(handler, message)
+        # .get(), so that unwaited messages don't leave empty deques behind
+        if q := self._wait_queue.get(msgcls):
+            q.popleft().set_result(message)
+        elif (handler := self._message_handlers.get(msgcls)) is not None:
+            # Coroutine functions were wrapped by set_handler(), but other
+            # callables (eg a lambda around an async call) can still hand back
+            # an awaitable. Plain handlers return None, so this stays cheap.
+            if (rv := handler(message)) is not None and inspect.isawaitable(rv):
+                asyncio.ensure_future(rv)
 
     async def send(self, message: Message):
         """
@@ -133,7 +158,7 @@ class PixelLink:
         Note that if you want to send and receive a response, you should use
         :meth:`send_and_wait`, it has better async properties.
         """
-        fut = asyncio.get_event_loop().create_future()
+        fut = self._loop.create_future()
         self._wait_queue[msgcls].append(fut)
         return await fut
 
@@ -143,7 +168,7 @@ class PixelLink:
 
         Returns the response.
         """
-        fut = asyncio.get_event_loop().create_future()
+        fut = self._loop.create_future()
         self._wait_queue[respcls].append(fut)
         await self.send(msg)
         return await fut
@@ -1,10 +1,36 @@
 from dataclasses import dataclass
 import datetime
 from enum import Enum, IntEnum, auto
-from typing import Self
+import functools
 
 from .msglib import BasicMessage, EmptyMessage, StrMessage
 
+_UTC = datetime.timezone.utc
+_fromtimestamp = datetime.datetime.fromtimestamp
+
+
+@functools.lru_cache(maxsize=256)
+def _build_dt(ts: int) -> datetime.datetime:
+    """
+    Converts a firmware build timestamp. A die always reports the same one, in
+    every advertisement and :class:`IAmADie`.
+    """
+    return _fromtimestamp(ts, _UTC)
+
+
+class _MembersByValue(dict):
+    """
+    Enum members keyed by wire value. Cheaper than going through
+    EnumMeta.__call__ on every unpack; unknown values still go to the enum, for
+    its usual error.
+    """
+    def __init__(self, enum: type[Enum]):
+        super().__init__((m.value, m) for m in enum)
+        self.enum = enum
+
+    def __missing__(self, value):
+        return self.enum(value)
+
 
 class BatteryState(IntEnum):
     #: Discharging
@@ -39,6 +65,10 @@ class RollState_State(IntEnum):
     Crooked = 4
 
 
+_BATTSTATE_BY_VALUE = _MembersByValue(BatteryState)
+_ROLLSTATE_BY_VALUE = _MembersByValue(RollState_State)
+
+
 class RequestMode(IntEnum):
     """
     How much should a thing be reported.
@@ -53,14 +83,26 @@ class RequestMode(IntEnum):
     Repeat = 2
 
 
-@dataclass
+_REQUESTMODE_BY_VALUE = _MembersByValue(RequestMode)
+
+
+# Subclasses only need an ID. They inherit the (empty) dataclass methods
+# instead of each going through the dataclass decorator at import.
+@dataclass(slots=True)
+class _Placeholder(BasicMessage, format=""):
+    """
+    A message whose contents haven't been worked out yet.
+    """
+
+
+@dataclass(slots=True)
 class NoneMessage(EmptyMessage, id=0):
     """
     Filler for message type 0.
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class WhoAreYou(EmptyMessage, id=1):
     """
     Request some basic information.
@@ -82,34 +124,40 @@ class DieFlavor(Enum):
     @staticmethod
     def _from_led_count(leds: int) -> 'DieFlavor':
         try:
-            return {
-                4: DieFlavor.D4,
-                6: DieFlavor.D6,
-                8: DieFlavor.D8,
-                10: DieFlavor.D10,
-                12: DieFlavor.D12,
-                20: DieFlavor.D20,
-                21: DieFlavor.D6Pipped,
-                # ???: DieFlavor.D6Fudge
-            }[leds]
+            return _FLAVOR_BY_LED_COUNT[leds]
         except KeyError as exc:
-            raise ValueError("Unknown LED count: %i", leds) from exc
+            raise ValueError(f"Unknown LED count: {leds}") from exc
 
     @property
     def face_count(self) -> int:
         """
         Return the number of faces this flavor has.
         """
-        return {
-            DieFlavor.D4: 4,
-            DieFlavor.D6: 6,
-            DieFlavor.D8: 8,
-            DieFlavor.D10: 10,
-            DieFlavor.D12: 12,
-            DieFlavor.D20: 20,
-            DieFlavor.D6Pipped: 6,
-            DieFlavor.D6Fudge: 6,
-        }[self]
+        return _FACE_COUNTS[self]
+
+
+# Built once, instead of on every scan result and property access
+_FLAVOR_BY_LED_COUNT = {
+    4: DieFlavor.D4,
+    6: DieFlavor.D6,
+    8: DieFlavor.D8,
+    10: DieFlavor.D10,
+    12: DieFlavor.D12,
+    20: DieFlavor.D20,
+    21: DieFlavor.D6Pipped,
+    # ???: DieFlavor.D6Fudge
+}
+
+_FACE_COUNTS = {
+    DieFlavor.D4: 4,
+    DieFlavor.D6: 6,
+    DieFlavor.D8: 8,
+    DieFlavor.D10: 10,
+    DieFlavor.D12: 12,
+    DieFlavor.D20: 20,
+    DieFlavor.D6Pipped: 6,
+    DieFlavor.D6Fudge: 6,
+}
 
 
 class DesignAndColor(IntEnum):
@@ -128,7 +176,10 @@ class DesignAndColor(IntEnum):
     AuroraSky = 12
 
 
-@dataclass
+_DESIGN_BY_VALUE = _MembersByValue(DesignAndColor)
+
+
+@dataclass(slots=True)
 class IAmADie(BasicMessage, id=2, format="BB1xLLHL BB BB"):
     """
     A bunch of general info.
@@ -170,16 +221,12 @@ class IAmADie(BasicMessage, id=2, format="BB1xLLHL BB BB"):
         """
         return self.flavor.face_count
 
-    @classmethod
-    def __struct_unpack__(cls, blob: bytes) -> Self:
-        self = super().__struct_unpack__(blob)
-        self.roll_state = RollState_State(self.roll_state)
-        self.batt_state = BatteryState(self.batt_state)
-        self.design_and_color = DesignAndColor(self.design_and_color)
-        self.build_timestamp = datetime.datetime.fromtimestamp(
-            self.build_timestamp, tz=datetime.timezone.utc)
-
-        return self
+    _unpack_converters = {
+        'design_and_color': _DESIGN_BY_VALUE.__getitem__,
+        'build_timestamp': _build_dt,
+        'roll_state': _ROLLSTATE_BY_VALUE.__getitem__,
+        'batt_state': _BATTSTATE_BY_VALUE.__getitem__,
+    }
 
     def to_rollstate(self) -> 'RollState':
         """
@@ -200,7 +247,7 @@ class IAmADie(BasicMessage, id=2, format="BB1xLLHL BB BB"):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RollState(BasicMessage, id=3, format="BB"):
     """
     The current motion.
@@ -213,14 +260,10 @@ class RollState(BasicMessage, id=3, format="BB"):
     #: The upright face (starting at 0). Validity depends on :attr:`roll_state`.
     face: int
 
-    @classmethod
-    def __struct_unpack__(cls, blob: bytes) -> Self:
-        self = super().__struct_unpack__(blob)
-        self.state = RollState_State(self.state)
-        return self
+    _unpack_converters = {'state': _ROLLSTATE_BY_VALUE.__getitem__}
 
 
-@dataclass
+@dataclass(slots=True)
 class Telemetry(BasicMessage, id=4, format="50x BBBB bB hh BB"):
     # accelFrame: ...  # TODO
 
@@ -243,111 +286,89 @@ class Telemetry(BasicMessage, id=4, format="50x BBBB bB hh BB"):
     force_disable_charging_state: int
 
 
-@dataclass
-class BulkSetup(BasicMessage, id=5, format=""):
-    ...
+class BulkSetup(_Placeholder, id=5):
+    __slots__ = ()
 
 
-@dataclass
-class BulkSetupAck(BasicMessage, id=6, format=""):
-    ...
+class BulkSetupAck(_Placeholder, id=6):
+    __slots__ = ()
 
 
-@dataclass
-class BulkData(BasicMessage, id=7, format=""):
-    ...
+class BulkData(_Placeholder, id=7):
+    __slots__ = ()
 
 
-@dataclass
-class BulkDataAck(BasicMessage, id=8, format=""):
-    ...
+class BulkDataAck(_Placeholder, id=8):
+    __slots__ = ()
 
 
-@dataclass
-class TransferAnimationSet(BasicMessage, id=9, format=""):
-    ...
+class TransferAnimationSet(_Placeholder, id=9):
+    __slots__ = ()
 
 
-@dataclass
-class TransferAnimationSetAck(BasicMessage, id=10, format=""):
-    ...
+class TransferAnimationSetAck(_Placeholder, id=10):
+    __slots__ = ()
 
 
-@dataclass
-class TransferAnimationSetFinished(BasicMessage, id=11, format=""):
-    ...
+class TransferAnimationSetFinished(_Placeholder, id=11):
+    __slots__ = ()
 
 
-@dataclass
-class TransferSettings(BasicMessage, id=12, format=""):
-    ...
+class TransferSettings(_Placeholder, id=12):
+    __slots__ = ()
 
 
-@dataclass
-class TransferSettingsAck(BasicMessage, id=13, format=""):
-    ...
+class TransferSettingsAck(_Placeholder, id=13):
+    __slots__ = ()
 
 
-@dataclass
-class TransferSettingsFinished(BasicMessage, id=14, format=""):
-    ...
+class TransferSettingsFinished(_Placeholder, id=14):
+    __slots__ = ()
 
 
-@dataclass
-class TransferTestAnimationSet(BasicMessage, id=15, format=""):
-    ...
+class TransferTestAnimationSet(_Placeholder, id=15):
+    __slots__ = ()
 
 
-@dataclass
-class TransferTestAnimationSetAck(BasicMessage, id=16, format=""):
-    ...
+class TransferTestAnimationSetAck(_Placeholder, id=16):
+    __slots__ = ()
 
 
-@dataclass
-class TransferTestAnimationSetFinished(BasicMessage, id=17, format=""):
-    ...
+class TransferTestAnimationSetFinished(_Placeholder, id=17):
+    __slots__ = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class DebugLog(StrMessage, id=18):
     text: str
 
-    @classmethod
-    def __struct_unpack__(cls, blob: bytes) -> Self:
-        return cls(
-            text=blob.decode('utf-8')
-        )
-
-    def __struct_pack__(self) -> bytes:
-        return self.text.encode('utf-8')
 
-
-@dataclass
+@dataclass(slots=True)
 class PlayAnimation(BasicMessage, id=19, format="BBB"):
     animation: int
     remap_face: int
     loop: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayAnimationEvent(BasicMessage, id=20, format="BBB"):
     evt: int
     remap_face: int
     loop: int
 
 
-@dataclass
+@dataclass(slots=True)
 class StopAnimation(BasicMessage, id=21, format="BB"):
     animation: int
     remap_face: int
 
 
-@dataclass
+@dataclass(slots=True)
 class RemoteAction(BasicMessage, id=22, format="H"):
     action_id: int
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestRollState(EmptyMessage, id=23):
     """
     Request the current roll state.
@@ -356,32 +377,27 @@ class RequestRollState(EmptyMessage, id=23):
     """
 
 
-@dataclass
-class RequestAnimationSet(BasicMessage, id=24, format=""):
-    ...
+class RequestAnimationSet(_Placeholder, id=24):
+    __slots__ = ()
 
 
-@dataclass
-class RequestSettings(BasicMessage, id=25, format=""):
-    ...
+class RequestSettings(_Placeholder, id=25):
+    __slots__ = ()
 
 
-@dataclass
-class RequestTelemetry(BasicMessage, id=26, format=""):
-    ...
+class RequestTelemetry(_Placeholder, id=26):
+    __slots__ = ()
 
 
-@dataclass
-class ProgramDefaultAnimationSet(BasicMessage, id=27, format=""):
-    ...
+class ProgramDefaultAnimationSet(_Placeholder, id=27):
+    __slots__ = ()
 
 
-@dataclass
-class ProgramDefaultAnimationSetFinished(BasicMessage, id=28, format=""):
-    ...
+class ProgramDefaultAnimationSetFinished(_Placeholder, id=28):
+    __slots__ = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class Blink(BasicMessage, id=29, format="BHLLBB"):
     """
     Do a custom blink.
@@ -396,24 +412,22 @@ class Blink(BasicMessage, id=29, format="BHLLBB"):
     loop: int  # TODO: bool/enum
 
 
-@dataclass
+@dataclass(slots=True)
 class BlinkAck(EmptyMessage, id=30):
     """
     Reply to :class:`Blink`.
     """
 
 
-@dataclass
-class RequestDefaultAnimationSetColor(BasicMessage, id=31, format=""):
-    ...
+class RequestDefaultAnimationSetColor(_Placeholder, id=31):
+    __slots__ = ()
 
 
-@dataclass
-class DefaultAnimationSetColor(BasicMessage, id=32, format=""):
-    ...
+class DefaultAnimationSetColor(_Placeholder, id=32):
+    __slots__ = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestBatteryLevel(EmptyMessage, id=33):
     """
     Request the current battery.
@@ -422,7 +436,7 @@ class RequestBatteryLevel(EmptyMessage, id=33):
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class BatteryLevel(BasicMessage, id=34, format="BB"):
     """
     Current state of the battery.
@@ -435,14 +449,10 @@ class BatteryLevel(BasicMessage, id=34, format="BB"):
     #: The current charge state
     state: BatteryState
 
-    @classmethod
-    def __struct_unpack__(cls, blob: bytes) -> Self:
-        self = super().__struct_unpack__(blob)
-        self.state = BatteryState(self.state)
-        return self
+    _unpack_converters = {'state': _BATTSTATE_BY_VALUE.__getitem__}
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestRssi(BasicMessage, id=35, format="BH"):
     """
     Request RSSI.
@@ -454,14 +464,10 @@ class RequestRssi(BasicMessage, id=35, format="BH"):
     #: Interval of repeated reports, in milliseconds
     min_interval: int
 
-    @classmethod
-    def __struct_unpack__(cls, blob: bytes) -> Self:
-        self = super().__struct_unpack__(blob)
-        self.request_mode = RequestMode(self.request_mode)
-        return self
+    _unpack_converters = {'request_mode': _REQUESTMODE_BY_VALUE.__getitem__}
 
 
-@dataclass
+@dataclass(slots=True)
 class Rssi(BasicMessage, id=36, format="b"):
     """
     Report the current RSSI as seen by the die.
@@ -471,14 +477,14 @@ class Rssi(BasicMessage, id=36, format="b"):
     rssi: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Calibrate(EmptyMessage, id=37):
     """
     Start the calibration process.
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class CalibrateFace(BasicMessage, id=38, format="B"):
     """
     Immediately calibrate the given face.
@@ -486,7 +492,7 @@ class CalibrateFace(BasicMessage, id=38, format="B"):
     face: int
 
 
-@dataclass
+@dataclass(slots=True)
 class NotifyUser(BasicMessage, id=39, format="BBB"):
     """
     Die asking the user a question
@@ -500,12 +506,7 @@ class NotifyUser(BasicMessage, id=39, format="BBB"):
     #: Prompt to show the user
     text: str
 
-    @classmethod
-    def __struct_unpack__(cls, blob: bytes) -> Self:
-        self = super().__struct_unpack__(blob)
-        self.ok = bool(self.ok)
-        self.cancel = bool(self.cancel)
-        return self
+    _unpack_converters = {'ok': bool, 'cancel': bool}
 
 
 class OkCancel(IntEnum):
@@ -516,71 +517,60 @@ class OkCancel(IntEnum):
     Ok = 1
 
 
-@dataclass
+_OKCANCEL_BY_VALUE = _MembersByValue(OkCancel)
+
+
+@dataclass(slots=True)
 class NotifyUserAck(BasicMessage, id=40, format="B"):
     """
     Response to :class:`NotifyUser`
     """
     ok_cancel: OkCancel
 
-    @classmethod
-    def __struct_unpack__(cls, blob: bytes) -> Self:
-        self = super().__struct_unpack__(blob)
-        self.ok_cancel = OkCancel(self.ok_cancel)
-        return self
+    _unpack_converters = {'ok_cancel': _OKCANCEL_BY_VALUE.__getitem__}
 
 
-@dataclass
-class TestHardware(BasicMessage, id=41, format=""):
-    ...
+class TestHardware(_Placeholder, id=41):
+    __slots__ = ()
 
 
-@dataclass
-class TestLEDLoopback(BasicMessage, id=42, format=""):
-    ...
+class TestLEDLoopback(_Placeholder, id=42):
+    __slots__ = ()
 
 
-@dataclass
-class LedLoopback(BasicMessage, id=43, format=""):
-    ...
+class LedLoopback(_Placeholder, id=43):
+    __slots__ = ()
 
 
-@dataclass
-class SetTopLevelState(BasicMessage, id=44, format=""):
-    ...
+class SetTopLevelState(_Placeholder, id=44):
+    __slots__ = ()
 
 
-@dataclass
-class ProgramDefaultParameters(BasicMessage, id=45, format=""):
-    ...
+class ProgramDefaultParameters(_Placeholder, id=45):
+    __slots__ = ()
 
 
-@dataclass
-class ProgramDefaultParametersFinished(BasicMessage, id=46, format=""):
-    ...
+class ProgramDefaultParametersFinished(_Placeholder, id=46):
+    __slots__ = ()
 
 
-@dataclass
-class SetDesignAndColor(BasicMessage, id=47, format=""):
-    ...
+class SetDesignAndColor(_Placeholder, id=47):
+    __slots__ = ()
 
 
-@dataclass
-class SetDesignAndColorAck(BasicMessage, id=48, format=""):
-    ...
+class SetDesignAndColorAck(_Placeholder, id=48):
+    __slots__ = ()
 
 
-@dataclass
-class SetCurrentBehavior(BasicMessage, id=49, format=""):
-    ...
+class SetCurrentBehavior(_Placeholder, id=49):
+    __slots__ = ()
 
 
-@dataclass
-class SetCurrentBehaviorAck(BasicMessage, id=50, format=""):
-    ...
+class SetCurrentBehaviorAck(_Placeholder, id=50):
+    __slots__ = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class SetName(StrMessage, id=51):
     """
     Change the name of the die.
@@ -588,51 +578,45 @@ class SetName(StrMessage, id=51):
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SetNameAck(EmptyMessage, id=52):
     """
     Acknowledges :class:`SetName`.
     """
 
 
-@dataclass
-class Sleep(BasicMessage, id=53, format=""):
-    ...
+class Sleep(_Placeholder, id=53):
+    __slots__ = ()
 
 
-@dataclass
-class ExitValidation(BasicMessage, id=54, format=""):
-    ...
+class ExitValidation(_Placeholder, id=54):
+    __slots__ = ()
 
 
-@dataclass
-class TransferInstantAnimationSet(BasicMessage, id=55, format=""):
-    ...
+class TransferInstantAnimationSet(_Placeholder, id=55):
+    __slots__ = ()
 
 
-@dataclass
-class TransferInstantAnimationSetAck(BasicMessage, id=56, format=""):
-    ...
+class TransferInstantAnimationSetAck(_Placeholder, id=56):
+    __slots__ = ()
 
 
-@dataclass
-class TransferInstantAnimationSetFinished(BasicMessage, id=57, format=""):
-    ...
+class TransferInstantAnimationSetFinished(_Placeholder, id=57):
+    __slots__ = ()
 
 
-@dataclass
-class PlayInstantAnimation(BasicMessage, id=58, format=""):
-    ...
+class PlayInstantAnimation(_Placeholder, id=58):
+    __slots__ = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class StopAllAnimations(EmptyMessage, id=59):
     """
     Stop all animations.
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestTemperature(EmptyMessage, id=60):
     """
     Get the current temperature
@@ -641,7 +625,7 @@ class RequestTemperature(EmptyMessage, id=60):
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class Temperature(BasicMessage, id=61, format="hh"):
     #: CPU temp in centidegrees Celsius
     mcu_temp: int
@@ -649,89 +633,74 @@ class Temperature(BasicMessage, id=61, format="hh"):
     batt_temp: int
 
 
-@dataclass
-class EnableCharging(BasicMessage, id=62, format=""):
-    ...
+class EnableCharging(_Placeholder, id=62):
+    __slots__ = ()
 
 
-@dataclass
-class DisableCharging(BasicMessage, id=63, format=""):
-    ...
+class DisableCharging(_Placeholder, id=63):
+    __slots__ = ()
 
 
-@dataclass
-class Discharge(BasicMessage, id=64, format=""):
-    ...
+class Discharge(_Placeholder, id=64):
+    __slots__ = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class BlinkId(BasicMessage, id=65, format="BB"):
     brightness: int
     loop: int
 
 
-@dataclass
+@dataclass(slots=True)
 class BlinkIdAck(EmptyMessage, id=66):
     pass
 
 
 # FIXME: Do these TransferTest* messages exist?
 # FIXME: Are messages beyond this point numbered correctly?
-@dataclass
-class TransferTest(BasicMessage, id=67, format=""):
-    ...
+class TransferTest(_Placeholder, id=67):
+    __slots__ = ()
 
 
-@dataclass
-class TransferTestAck(BasicMessage, id=68, format=""):
-    ...
+class TransferTestAck(_Placeholder, id=68):
+    __slots__ = ()
 
 
-@dataclass
-class TransferTestFinished(BasicMessage, id=69, format=""):
-    ...
+class TransferTestFinished(_Placeholder, id=69):
+    __slots__ = ()
 
 
-@dataclass
-class TestBulkSend(BasicMessage, id=70, format=""):
-    ...
+class TestBulkSend(_Placeholder, id=70):
+    __slots__ = ()
 
 
-@dataclass
-class TestBulkReceive(BasicMessage, id=71, format=""):
-    ...
+class TestBulkReceive(_Placeholder, id=71):
+    __slots__ = ()
 
 
-@dataclass
-class SetAllLEDsToColor(BasicMessage, id=72, format=""):
-    ...
+class SetAllLEDsToColor(_Placeholder, id=72):
+    __slots__ = ()
 
 
-@dataclass
-class AttractMode(BasicMessage, id=73, format=""):
-    ...
+class AttractMode(_Placeholder, id=73):
+    __slots__ = ()
 
 
-@dataclass
-class PrintNormals(BasicMessage, id=74, format=""):
-    ...
+class PrintNormals(_Placeholder, id=74):
+    __slots__ = ()
 
 
-@dataclass
-class PrintA2DReadings(BasicMessage, id=75, format=""):
-    ...
+class PrintA2DReadings(_Placeholder, id=75):
+    __slots__ = ()
 
 
-@dataclass
-class LightUpFace(BasicMessage, id=76, format=""):
-    ...
+class LightUpFace(_Placeholder, id=76):
+    __slots__ = ()
 
 
-@dataclass
-class SetLEDToColor(BasicMessage, id=77, format=""):
-    ...
+class SetLEDToColor(_Placeholder, id=77):
+    __slots__ = ()
 
 
-@dataclass
-class DebugAnimationController(BasicMessage, id=78, format=""):
-    ...
+class DebugAnimationController(_Placeholder, id=78):
+    __slots__ = ()
@@ -3,15 +3,17 @@ Library to define packed messages and going between blobs and structures.
 """
 import abc
 import dataclasses
+import functools
 import logging
+import operator
 import struct
-import sys
-from typing import Optional, Self, Iterable
+from typing import Callable, Optional, Self, Iterable
 import typing_extensions
 
 
 LOG = logging.getLogger(__name__)
-_messages = {}
+#: Message classes, indexed by their (single byte) ID
+_messages: list[type['Message'] | None] = [None] * 256
 
 
 class UnrecognizedMessageError(ValueError):
@@ -36,7 +38,7 @@ def iter_msgs() -> Iterable[type['Message']]:
     """
     List all known messages.
     """
-    yield from _messages.values()
+    yield from (m for m in _messages if m is not None)
 
 
 def msgid(msg: 'Message') -> int:
@@ -55,26 +57,28 @@ def pack(msg: 'Message') -> typing_extensions.Buffer:
     """
     Produce a blob from a message.
     """
-    blob = bytes([msgid(msg)]) + msg.__struct_pack__()
-    return blob
+    try:
+        prefix = msg._Message__prefix
+    except AttributeError:
+        raise AbstractMessageGivenError(f"{msg!r} does not have an ID") from None
+    return prefix + msg.__struct_pack__()
 
 
 def unpack(blob: typing_extensions.Buffer) -> 'Message':
     """
     Turn a Message into a blob.
     """
-    msgid, body = blob[0], blob[1:]
+    # A view, so the body doesn't get copied just to drop the ID
+    msgid, body = blob[0], memoryview(blob)[1:]
+    msgcls = _messages[msgid]
+    if msgcls is None:
+        raise UnrecognizedMessageError(f"Unknown message ID={msgid:X} ({blob!r})")
     try:
-        msgcls = _messages[msgid]
-    except KeyError as exc:
-        raise UnrecognizedMessageError(f"Unknown message ID={msgid:X} ({blob!r})") from exc
+        msg = msgcls.__struct_unpack__(body)
+    except Exception as exc:
+        raise UnpackError(f"Problem unpacking blob ({blob!r})") from exc
     else:
-        try:
-            msg = msgcls.__struct_unpack__(body)
-        except Exception as exc:
-            raise UnpackError(f"Problem unpacking blob ({blob!r})") from exc
-        else:
-            return msg
+        return msg
 
 
 class Message(abc.ABC):
@@ -85,17 +89,21 @@ class Message(abc.ABC):
 
         class Spam(Message, id=42):
 
-    Pass :const:`None` as the ID if this should not be registered
+    Leave off the ID (or pass :const:`None`) if this should not be registered
     as a message (eg, is abstract).
 
     Args:
         id (int|None): The message ID or None.
     """
+    __slots__ = ()
+
     @classmethod
     @abc.abstractmethod
-    def __struct_unpack__(cls, blob: bytes) -> Self:
+    def __struct_unpack__(cls, blob: typing_extensions.Buffer) -> Self:
         """
         Construct an instance from a message blob.
+
+        The blob may be a :class:`memoryview`, not just :class:`bytes`.
         """
         raise NotImplementedError
 
@@ -106,10 +114,16 @@ class Message(abc.ABC):
         """
         raise NotImplementedError
 
-    def __init_subclass__(cls, /, id: int | None, **kwargs):
+    def __init_subclass__(cls, /, id: int | None = None, **kwargs):
         super().__init_subclass__(**kwargs)
+        if id is None:
+            # A class rebuilt by dataclass(slots=True) doesn't get the class
+            # keywords again, but does get a copy of the namespace.
+            id = cls.__dict__.get('_Message__id')
         if id is not None:
             cls.__id = id
+            # The ID byte that starts every packed message
+            cls.__prefix = bytes((id,))
             _messages[id] = cls
 
 
@@ -119,12 +133,75 @@ def _str_field_name(cls_or_object) -> Optional[str]:
     if there is one.
     """
     flds = dataclasses.fields(cls_or_object)
-    f = flds[-1]
-    if f.type == str:
-        return f.name
+    if flds and flds[-1].type == str:
+        return flds[-1].name
+
 
+def _values_getter(names: list[str]) -> Callable[[object], tuple]:
+    """
+    Builds a function that pulls the named attributes, as a tuple.
 
-class BasicMessage(Message, id=None):
+    Unlike :func:`dataclasses.astuple`, this doesn't recurse or copy anything.
+    """
+    if not names:
+        return lambda _: ()
+    elif len(names) == 1:
+        getter = operator.attrgetter(*names)
+        return lambda obj: (getter(obj),)
+    else:
+        return operator.attrgetter(*names)
+
+
+@functools.cache
+def _basic_codec(cls) -> tuple[Callable, Callable]:
+    """
+    Builds unpack and pack functions specialized to a :class:`BasicMessage`
+    subclass.
+
+    This has to happen lazily, since the dataclass fields don't exist yet
+    during ``__init_subclass__``.
+    """
+    st = cls._BasicMessage__struct
+    names = [f.name for f in dataclasses.fields(cls)]
+
+    # (index, converter) pairs, applied to the raw values before construction
+    convs = [
+        (names.index(name), conv)
+        for name, conv in getattr(cls, '_unpack_converters', {}).items()
+    ]
+
+    if _str_field_name(cls) is None:
+        unpack, pack, get = st.unpack, st.pack, _values_getter(names)
+
+        if convs:
+            def unpack_msg(blob):
+                values = list(unpack(blob))
+                for i, conv in convs:
+                    values[i] = conv(values[i])
+                return cls(*values)
+        else:
+            def unpack_msg(blob):
+                return cls(*unpack(blob))
+
+        def pack_msg(msg):
+            return pack(*get(msg))
+    else:
+        unpack, pack, size = st.unpack_from, st.pack, st.size
+        get, get_str = _values_getter(names[:-1]), operator.attrgetter(names[-1])
+
+        def unpack_msg(blob):
+            values = [*unpack(blob), str(blob[size:], 'utf-8')]
+            for i, conv in convs:
+                values[i] = conv(values[i])
+            return cls(*values)
+
+        def pack_msg(msg):
+            return pack(*get(msg)) + get_str(msg).encode('utf-8')
+
+    return unpack_msg, pack_msg
+
+
+class BasicMessage(Message):
     """
     Provides a helpful basic version of :class:`Message`
     for standard use cases.
@@ -142,54 +219,69 @@ class BasicMessage(Message, id=None):
         format (str): The format in :mod:`struct` form.
 
     If the last field is a `str`, then it consumes the entire rest of the message.
+
+    Fields that need converting from their raw :mod:`struct` value (eg, to an
+    enum) can be listed in a ``_unpack_converters`` class attribute, mapping
+    field names to a callable that takes the raw value::
+
+        @dataclass
+        class Spam(BasicMessage, id=42, format='B'):
+            eggs: Eggs
+
+            _unpack_converters = {'eggs': Eggs}
     """
-    def __init_subclass__(cls, /, format: str, **kwargs):
+    __slots__ = ()
+
+    def __init_subclass__(cls, /, format: str | None = None, **kwargs):
         super().__init_subclass__(**kwargs)
-        cls.__struct_format = sys.intern(f"<{format}")
+        # Compile the format once, instead of on every pack and unpack. No
+        # format means an abstract base, or a rebuilt class that already has it.
+        if format is not None:
+            cls.__struct = struct.Struct(f"<{format}")
 
     @classmethod
-    def __struct_unpack__(cls, blob: bytes) -> Self:
-        sfld = _str_field_name(cls)
-        if sfld is not None:
-            slen = struct.calcsize(cls.__struct_format)
-            blob, bin = blob[:slen], blob[slen:]
-        fields = struct.unpack(cls.__struct_format, blob)
-        if sfld is None:
-            return cls(*fields)
-        else:
-            return cls(*fields, bin.decode('utf-8'))
+    def __struct_unpack__(cls, blob: typing_extensions.Buffer) -> Self:
+        return _basic_codec(cls)[0](blob)
 
     def __struct_pack__(self) -> bytes:
-        sfld = _str_field_name(self)
-        fields = dataclasses.astuple(self)
-        if sfld is None:
-            return struct.pack(self.__struct_format, *fields)
-        else:
-            return struct.pack(self.__struct_format, *fields[:-1]) + fields[-1].encode('utf-8')
+        return _basic_codec(type(self))[1](self)
 
 
-class StrMessage(Message, id=None):
+@functools.cache
+def _str_getter(cls) -> Callable[[object], str]:
+    """
+    Builds a getter for the string field of a :class:`StrMessage` subclass.
+
+    Lazy for the same reason as :func:`_basic_codec`.
+    """
+    return operator.attrgetter(dataclasses.fields(cls)[-1].name)
+
+
+class StrMessage(Message):
     """
     Define a message with one string field.
 
     Must be a dataclass.
     """
+    __slots__ = ()
+
     @classmethod
-    def __struct_unpack__(cls, blob: bytes) -> Self:
-        field = dataclasses.fields(cls)[-1].name
-        return cls(**{field: blob.decode('utf-8')})
+    def __struct_unpack__(cls, blob: typing_extensions.Buffer) -> Self:
+        # The one field, so it can be passed positionally
+        return cls(str(blob, 'utf-8'))
 
     def __struct_pack__(self) -> bytes:
-        field = dataclasses.fields(self)[-1].name
-        return getattr(self, field).encode('utf-8')
+        return _str_getter(type(self))(self).encode('utf-8')
 
 
-class EmptyMessage(Message, id=None):
+class EmptyMessage(Message):
     """
     Quick class for defining messages with no fields.
     """
+    __slots__ = ()
+
     @classmethod
-    def __struct_unpack__(cls, blob: bytes) -> Self:
+    def __struct_unpack__(cls, blob: typing_extensions.Buffer) -> Self:
         return cls()
 
     def __struct_pack__(self) -> bytes:
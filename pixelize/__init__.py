@@ -1,6 +1,7 @@
+import logging
+
 from textual import work, on
 from textual.app import App
-from textual.css.query import NoMatches
 from textual.reactive import reactive
 from textual.screen import Screen
 from textual.containers import (
@@ -16,6 +17,8 @@ from nat20.messages import DieFlavor, RollState_State
 from .junk_drawer import WorkingModal
 from .die_details import DieDetailsScreen
 
+LOG = logging.getLogger(__name__)
+
 
 class DieSummary(Static):
     """
@@ -29,11 +32,12 @@ class DieSummary(Static):
     batt_level = reactive(0)
 
     def update_from_result(self, sr: ScanResult):
-        for attr in dir(sr):
-            if attr == 'name':
-                self.die_name = sr.name
-            elif hasattr(self, attr) and not attr.startswith('_'):
-                setattr(self, attr, getattr(sr, attr))
+        # Runs for every advertisement, so just copy the fields we show
+        self.die_name = sr.name
+        self.flavor = sr.flavor
+        self.face = sr.roll_face
+        self.roll_state = sr.roll_state
+        self.batt_level = sr.batt_level
 
         if self.roll_state in (RollState_State.OnFace, RollState_State.Crooked):
             self.remove_class("rolling")
@@ -54,28 +58,25 @@ class DieSummary(Static):
 
 class Die(Static):
     _scan_result: ScanResult
+    #: The summary widget, once composed
+    _info: DieSummary | None = None
 
     def update_from_result(self, sr: ScanResult):
         self._scan_result = sr
-        try:
-            info = self.query_one(DieSummary)
-        except NoMatches:
-            pass
-        else:
-            info.update_from_result(sr)
+        if self._info is not None:
+            self._info.update_from_result(sr)
 
     @on(Button.Pressed, '#connect')
     def on_connect(self):
         die = self._scan_result.hydrate()
 
         async def connect():
-            print("connecting")
+            LOG.debug("Connecting to %s", die.name)
             await die.connect()
             return die
 
         def switch(die):
-            print("Open the dice now hal")
-            print(die)
+            LOG.debug("Connected to %r", die)
             self.app.push_screen(
                 DieDetailsScreen(die, self._scan_result)
             )
@@ -88,15 +89,21 @@ class Die(Static):
     def compose(self):
         yield Button("Connect", id="connect")
         yield (ds := DieSummary(id="info"))
+        self._info = ds
         if self._scan_result is not None:
             ds.update_from_result(self._scan_result)
 
 
 class DiceBagScreen(Screen):
+    #: The mounted Die widgets, by widget ID
+    _dice: dict[str, Die]
+
     def compose(self):
         yield Header()
         yield Footer()
         yield VerticalScroll(id="dice")
+        # Goes with the container, which starts out empty
+        self._dice = {}
 
     def on_mount(self, event):
         self.search_for_devices()
@@ -106,14 +113,12 @@ class DiceBagScreen(Screen):
         """
         Run the BLE Scanner and update the app data
         """
+        bag = self.get_child_by_id('dice')
         async for dev in scan_for_dice():
             cid = f"die_{dev.pixel_id:08X}"
-            bag = self.get_child_by_id('dice')
-            try:
-                die = bag.get_child_by_id(cid)
-            except NoMatches:
+            if (die := self._dice.get(cid)) is None:
                 # Create a new die
-                die = Die(id=cid)
+                die = self._dice[cid] = Die(id=cid)
                 die.update_from_result(dev)
                 bag.mount(die, before=0)
             else:
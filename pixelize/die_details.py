@@ -1,3 +1,4 @@
+import logging
 from typing import Callable
 
 from textual import on, work
@@ -14,6 +15,8 @@ from nat20.messages import (
 
 from .junk_drawer import ActionButton, Jumbo, OkCancelModal, WorkingModal
 
+LOG = logging.getLogger(__name__)
+
 
 class DoubleLabel(Static):
     left = reactive("")
@@ -44,17 +47,17 @@ class BatteryLabel(Label):
         self.percent = percent
 
     def render(self):
-        match self.state:
-            case BatteryState.Ok:
-                prefix = "\U0001F50B"
-            case BatteryState.Low:
-                prefix = "\U0001FAAB"
-            case BatteryState.Charging | BatteryState.Done:
-                prefix = "\U000026A1"
-            case BatteryState.BadCharging | BatteryState.Error:
-                prefix = "\U000026A0"
+        return f"{_BATTERY_PREFIXES[self.state]}{self.percent}%"
+
 
-        return f"{prefix}{self.percent}%"
+_BATTERY_PREFIXES = {
+    BatteryState.Ok: "\U0001F50B",
+    BatteryState.Low: "\U0001FAAB",
+    BatteryState.Charging: "\U000026A1",
+    BatteryState.Done: "\U000026A1",
+    BatteryState.BadCharging: "\U000026A0",
+    BatteryState.Error: "\U000026A0",
+}
 
 
 class FaceLabel(Label):
@@ -115,25 +118,22 @@ class FlavorLabel(Label):
         self.flavor = flavor
 
     def render(self):
-        match self.flavor:
-            case DieFlavor.D4:
-                return "Flavor: D4"
-            case DieFlavor.D6:
-                return "Flavor: D6"
-            case DieFlavor.D6Pipped:
-                return "Flavor: D6 (Pipped)"
-            case DieFlavor.D6Fudge:
-                return "Flavor: Fudge"
-            case DieFlavor.D8:
-                return "Flavor: D8"
-            case DieFlavor.D10:
-                return "Flavor: D10"
-            case DieFlavor.D12:
-                return "Flavor: D12"
-            case DieFlavor.D20:
-                return "Flavor: D20"
-            case flavor:
-                return f"Flavor: {flavor}"
+        try:
+            return _FLAVOR_LABELS[self.flavor]
+        except KeyError:
+            return f"Flavor: {self.flavor}"
+
+
+_FLAVOR_LABELS = {
+    DieFlavor.D4: "Flavor: D4",
+    DieFlavor.D6: "Flavor: D6",
+    DieFlavor.D6Pipped: "Flavor: D6 (Pipped)",
+    DieFlavor.D6Fudge: "Flavor: Fudge",
+    DieFlavor.D8: "Flavor: D8",
+    DieFlavor.D10: "Flavor: D10",
+    DieFlavor.D12: "Flavor: D12",
+    DieFlavor.D20: "Flavor: D20",
+}
 
 
 class ChangeNameModal(ModalScreen):
@@ -202,7 +202,7 @@ class DieDetailsScreen(Screen):
         await self.die.who_are_you()  # Relies on firing the data_changed event
 
     async def update_data(self, _, props):
-        print("Got updated data", props)
+        LOG.debug("Got updated data %r", props)
         self.get_child_by_id('title').text = self.die.name
         self.get_child_by_id('id').die_id = self.die.pixel_id
         self.get_child_by_id('face').state = self.die.roll_state
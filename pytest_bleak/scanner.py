@@ -1,4 +1,5 @@
 import asyncio
+import contextlib
 from typing import Self
 
 import bleak.backends.scanner
@@ -44,7 +45,9 @@ class BleakScannerDummy(bleak.backends.scanner.BaseBleakScanner):
     async def stop(self):
         if self._task is not None:
             self._task.cancel()
-            await self._task
+            # The cancellation is ours, it shouldn't escape from stop()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
             self._task = None
 
     async def set_scanning_filter(self, **_):
@@ -1,11 +1,24 @@
 import asyncio
+import contextlib
 
 import pytest
 
-from nat20 import scan_for_dice
+from nat20 import Pixel, scan_for_dice
+from nat20.messages import RollState
 from pytest_pixels import DieFacade, dieresult
 
 
+async def first_die():
+    """
+    Scans until a die turns up, closing the scan (and the scanner) before
+    returning it.
+    """
+    async with contextlib.aclosing(scan_for_dice()) as scan:
+        async for sr in scan:
+            return sr
+    assert False, "Scan ended without finding a die"
+
+
 @pytest.mark.scanresults([
     dieresult(DieFacade.with_responses({
         b'\x01': b'\x02\x14\x0b\x00\x12\xa6\xbe\xb3Z\x8a\xf0\x060\x1e\x17\x87\x88d\x01\x05O\x00',
@@ -13,13 +26,161 @@ from pytest_pixels import DieFacade, dieresult
 ])
 async def test_who():
     async with asyncio.timeout(1):
-        async for sr in scan_for_dice():
-            break
-        else:
-            assert False
+        sr = await first_die()
 
         device = sr.hydrate()
         await device.connect()
         iam = await device.who_are_you()
 
     assert iam
+
+
+@pytest.mark.scanresults([
+    dieresult(DieFacade.with_responses({
+        b'\x17': b'\x03\x01\x05',
+    })),
+])
+async def test_roll_state_changes_once():
+    async with asyncio.timeout(1):
+        sr = await first_die()
+
+        device = sr.hydrate()
+        changes = []
+        device.data_changed.handler(lambda _, props: changes.append(props))
+        await device.connect()
+        rs = await device.get_roll_state()
+        await asyncio.sleep(0)
+
+    assert rs.face == 5
+    assert device.roll_face == 5
+    assert changes == [{'roll_state', 'roll_face'}]
+
+
+@pytest.mark.scanresults([
+    dieresult(DieFacade),
+])
+async def test_roll_callback():
+    async with asyncio.timeout(1):
+        sr = await first_die()
+
+        device = sr.hydrate()
+        got = []
+        device.add_roll_callback(got.append)
+        await device.connect()
+        device._link._recv_notify(None, bytearray(b'\x03\x01\x05'))
+
+    assert [rs.face for rs in got] == [5]
+    assert device.roll_face == 5
+
+
+@pytest.mark.scanresults([
+    dieresult(DieFacade),
+])
+async def test_roll_callback_removes_itself():
+    async with asyncio.timeout(1):
+        sr = await first_die()
+
+        device = sr.hydrate()
+        got = []
+
+        def once(rs):
+            got.append(('once', rs.face))
+            device.remove_roll_callback(once)
+
+        device.add_roll_callback(once)
+        device.add_roll_callback(lambda rs: got.append(('other', rs.face)))
+        await device.connect()
+        device._link._recv_notify(None, bytearray(b'\x03\x01\x05'))
+        device._link._recv_notify(None, bytearray(b'\x03\x01\x02'))
+
+    assert got == [('once', 5), ('other', 5), ('other', 2)]
+
+
+@pytest.mark.scanresults([
+    dieresult(DieFacade),
+])
+async def test_class_level_handler():
+    # Class-level handlers live on the Event, not the per-instance BoundEvent,
+    # and still have to fire.
+    changes = []
+
+    def on_change(_, props):
+        changes.append(props)
+
+    Pixel.data_changed.handler(on_change)
+    try:
+        async with asyncio.timeout(1):
+            sr = await first_die()
+
+            device = sr.hydrate()
+            await device.connect()
+            device._link._recv_notify(None, bytearray(b'\x03\x01\x05'))
+            await asyncio.sleep(0)
+    finally:
+        Pixel.data_changed.discard(on_change)
+
+    assert changes == [{'roll_state', 'roll_face'}]
+
+
+@pytest.mark.scanresults([
+    dieresult(DieFacade),
+])
+async def test_executor_callback():
+    async with asyncio.timeout(1):
+        sr = await first_die()
+
+        device = sr.hydrate()
+        changes = []
+        device.data_changed.handler(lambda _, props: changes.append(props))
+        loop = asyncio.get_running_loop()
+        done = loop.create_future()
+
+        def callback(rs):
+            loop.call_soon_threadsafe(done.set_result, rs)
+
+        device.add_roll_callback(callback, executor=True)
+        await device.connect()
+        device._link._recv_notify(None, bytearray(b'\x03\x01\x05'))
+        rs = await done
+
+    assert rs.face == 5
+    # The Pixel's own handling still happens
+    assert device.roll_face == 5
+    assert changes == [{'roll_state', 'roll_face'}]
+
+
+@pytest.mark.scanresults([
+    dieresult(DieFacade),
+])
+async def test_executor_callback_not_async():
+    async with asyncio.timeout(1):
+        sr = await first_die()
+
+    async def callback(rs):
+        pass
+
+    device = sr.hydrate()
+    with pytest.raises(TypeError):
+        device.add_roll_callback(callback, executor=True)
+
+
+@pytest.mark.scanresults([
+    dieresult(DieFacade),
+])
+async def test_handler_returning_awaitable():
+    async with asyncio.timeout(1):
+        sr = await first_die()
+
+        device = sr.hydrate()
+        await device.connect()
+        done = asyncio.get_running_loop().create_future()
+
+        async def handle(msg):
+            done.set_result(msg)
+
+        # Not a coroutine function itself, but hands back a coroutine
+        device._link.set_handler(RollState, lambda msg: handle(msg))
+        device._link._recv_notify(None, bytearray(b'\x03\x01\x05'))
+        rs = await done
+
+    assert rs.face == 5
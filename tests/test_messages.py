@@ -0,0 +1,42 @@
+import pytest
+
+from nat20.messages import (
+    IAmADie, RollState, RollState_State, BatteryState, DesignAndColor,
+    NotifyUser, SetName, WhoAreYou, Blink, DebugLog,
+)
+from nat20.msglib import pack, unpack, UnrecognizedMessageError, UnpackError
+
+
+@pytest.mark.parametrize('msg', [
+    WhoAreYou(),
+    RollState(state=RollState_State.OnFace, face=5),
+    Blink(count=1, duration=1000, color=0xFF00FF, face_mask=0xFF, fade=0, loop=0),
+    SetName(name="Francis"),
+    DebugLog(text="spam"),
+    NotifyUser(timeout=30, ok=True, cancel=False, text="Hello"),
+])
+def test_roundtrip(msg):
+    assert unpack(pack(msg)) == msg
+
+
+def test_iamadie():
+    blob = b'\x02\x14\x0b\x00\x12\xa6\xbe\xb3Z\x8a\xf0\x060\x1e\x17\x87\x88d\x01\x05O\x00'
+    msg = unpack(blob)
+    assert isinstance(msg, IAmADie)
+    assert msg.led_count == 20
+    assert msg.design_and_color is DesignAndColor.MidnightGalaxy
+    assert msg.roll_state is RollState_State.OnFace
+    assert msg.roll_face == 5
+    assert msg.batt_level == 79
+    assert msg.batt_state is BatteryState.Ok
+    assert msg.build_timestamp.year == 2023
+
+
+def test_unknown_id():
+    with pytest.raises(UnrecognizedMessageError):
+        unpack(b'\xFE')
+
+
+def test_bad_body():
+    with pytest.raises(UnpackError):
+        unpack(b'\x03\x01')
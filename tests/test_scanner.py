@@ -4,6 +4,7 @@ import pytest
 from pytest_bleak import result
 from pytest_bleak.client import DeviceFacade
 
+import nat20
 from nat20 import scan_for_dice
 from pytest_pixels import DieFacade, dieresult
 
@@ -33,3 +34,50 @@ async def test_scan_yesdice():
             async for sr in scan_for_dice():
                 got_dice = True
     assert got_dice
+
+
+@pytest.mark.scanresults([
+    dieresult(DieFacade),
+])
+async def test_scan_skips_repeats():
+    seen = []
+    with pytest.raises(TimeoutError):
+        async with asyncio.timeout(0.5):
+            async for sr in scan_for_dice():
+                seen.append(sr)
+    assert len(seen) == 1
+
+
+@pytest.mark.scanresults([
+    # Francis, but with an LED count that doesn't map to a flavor
+    dieresult(DieFacade, manufacturer_data={0xFFFF: b'\x07\x0b\x01\nH'}),
+])
+async def test_scan_unknown_led_count():
+    seen = []
+    with pytest.raises(TimeoutError):
+        async with asyncio.timeout(0.25):
+            async for sr in scan_for_dice():
+                seen.append(sr)
+    assert len(seen) == 1
+    assert seen[0].led_count == 7
+    assert seen[0].flavor is None
+    with pytest.raises(ValueError):
+        seen[0].face_count
+
+
+@pytest.mark.scanresults([
+    dieresult(DieFacade, local_name=name)
+    for name in ['Able', 'Baker', 'Charlie', 'Dog']
+])
+async def test_scan_overflow_not_lost(monkeypatch):
+    monkeypatch.setattr(nat20, '_SCAN_BUFFER_SIZE', 2)
+    seen = set()
+    with pytest.raises(TimeoutError):
+        async with asyncio.timeout(1.5):
+            async for sr in scan_for_dice():
+                if not seen:
+                    # Stall, so the other dice overflow the buffer
+                    await asyncio.sleep(0.5)
+                seen.add(sr.name)
+    # Nobody changes, but every die still gets produced once
+    assert seen == {'Able', 'Baker', 'Charlie', 'Dog'}